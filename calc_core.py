@@ -0,0 +1,48 @@
+# ----------------------------
+# Núcleo de cálculo compartido
+# ----------------------------
+
+from functools import lru_cache
+
+# numba es opcional: si está instalado, la aritmética se compila a código
+# nativo (con caché en disco); si no, se usa el Python puro equivalente.
+try:
+    from numba import njit, float64
+    _scalar = njit(float64(float64, float64), cache=True, fastmath=True)
+except ImportError:
+    def _scalar(func):
+        return func
+
+@_scalar
+def _add(a, b):
+    return a + b
+
+@_scalar
+def _sub(a, b):
+    return a - b
+
+@_scalar
+def _mul(a, b):
+    return a * b
+
+@_scalar
+def _div(a, b):
+    return a / b
+
+_OPS = {
+    '+': _add,
+    '-': _sub,
+    '×': _mul,
+    '÷': _div,
+}
+
+SYMBOLS = frozenset(_OPS)
+
+@lru_cache(maxsize=512)
+def _calc(symbol: str, a: float, b: float) -> float:
+    if symbol == '÷' and b == 0:
+        raise ValueError("No se puede dividir entre cero.")
+    try:
+        return _OPS[symbol](a, b)
+    except KeyError:
+        raise ValueError(f"Operación no soportada: {symbol}") from None
@@ -1,109 +1,136 @@
 import tkinter as tk
-from abc import ABC, abstractmethod
+from functools import lru_cache, partial
+from tkinter import ttk
 
-# ----------------------------
-# Lógica de cálculo (S, O)
-# ----------------------------
-
-class OperationStrategy(ABC):
-    @abstractmethod
-    def execute(self, a, b):
-        pass
-
-class Add(OperationStrategy):
-    def execute(self, a, b):
-        return a + b
-
-class Subtract(OperationStrategy):
-    def execute(self, a, b):
-        return a - b
+from calc_core import _calc
 
-class Multiply(OperationStrategy):
-    def execute(self, a, b):
-        return a * b
-
-class Divide(OperationStrategy):
-    def execute(self, a, b):
-        if b == 0:
-            raise ValueError("No se puede dividir entre cero.")
-        return a / b
-
-# ----------------------------
-# Calculadora principal (S)
-# ----------------------------
-
-class Calculator:
-    def __init__(self):
-        self.result = 0
-
-    def calculate(self, a, b, operation: OperationStrategy):
-        return operation.execute(a, b)
+@lru_cache(maxsize=128)
+def _fmt(x: float) -> str:
+    return format(x, 'g')
 
 # ----------------------------
 # Interfaz gráfica (S)
 # ----------------------------
 
+# Disposición plana de los botones: (texto, fila, columna, columnspan),
+# calculada una vez a nivel de módulo.
+_LAYOUT = (
+    ('+', 3, 0, 1),
+    ('-', 3, 1, 1),
+    ('×', 4, 0, 1),
+    ('÷', 4, 1, 1),
+    ('Limpiar', 5, 0, 2),
+)
+
 class CalculatorGUI:
     def __init__(self, master):
-        self.calculator = Calculator()
         self.master = master
+        # Oculta la ventana mientras se crean los widgets: así el gestor
+        # de geometría hace una sola pasada en lugar de una por widget.
+        master.withdraw()
         master.title("Calculadora SOLID")
         # master.geometry("500x500")
 
         self.entry1 = tk.Entry(master)
         self.entry2 = tk.Entry(master)
+        # Sombra numérica: último par de textos ya convertido a float,
+        # para no re-parsear las entradas cuando no han cambiado.
+        self._values_key = None
+        self._values = (None, None)
         self.result_label = tk.Label(master, text="Resultado: ")
+        self._result_text = "Resultado: "
+        # Etiqueta de estado en línea para errores: evita el diálogo
+        # modal y se limpia sola a los 3 segundos.
+        self.status_label = tk.Label(master, text="", fg="red", font=('Arial', 10))
+        self._status_after = None
+        # Métodos ligados resueltos una sola vez para el camino caliente
+        # de cada clic (leer entradas y actualizar el resultado).
+        self._get1 = self.entry1.get
+        self._get2 = self.entry2.get
+        self._result_config = self.result_label.config
 
         self.entry1.grid(row=0, column=1, padx=5, pady=5)
         self.entry2.grid(row=1, column=1, padx=5, pady=5)
         tk.Label(master, text="Número 1:").grid(row=0, column=0)
         tk.Label(master, text="Número 2:").grid(row=1, column=0)
         self.result_label.grid(row=2, column=0, columnspan=2)
+        self.status_label.grid(row=6, column=0, columnspan=2)
 
         # Botones
         self._create_buttons()
 
+        # Pesos de la cuadrícula: una sola pasada tras crear los widgets,
+        # en lugar de reconfigurar fila/columna por cada widget.
+        for r in range(6):
+            master.grid_rowconfigure(r, weight=1)
+        for c in range(2):
+            master.grid_columnconfigure(c, weight=1)
+
+        master.update_idletasks()
+        master.deiconify()
+
     def _create_buttons(self):
-        tk.Button(self.master, text="+", command=self.add).grid(row=3, column=0)
-        tk.Button(self.master, text="-", command=self.subtract).grid(row=3, column=1)
-        tk.Button(self.master, text="×", command=self.multiply).grid(row=4, column=0)
-        tk.Button(self.master, text="÷", command=self.divide).grid(row=4, column=1)
-        tk.Button(self.master, text="Limpiar", command=self.clear_inputs).grid(row=5, column=0, columnspan=2)
+        # Un único estilo compartido: el tema de ttk guarda la apariencia
+        # una sola vez en lugar de configurarla botón por botón.
+        style = ttk.Style(self.master)
+        style.configure('Calc.TButton', font=('Arial', 12))
+        for text, row, col, span in _LAYOUT:
+            if text == 'Limpiar':
+                command = self.clear_inputs
+            else:
+                command = partial(self._calculate_and_display, text)
+            ttk.Button(self.master, text=text, style='Calc.TButton',
+                       command=command).grid(row=row, column=col, columnspan=span)
+
+    def show_error(self, message):
+        self.status_label.config(text=message)
+        if self._status_after is not None:
+            self.master.after_cancel(self._status_after)
+        self._status_after = self.master.after(3000, self._clear_status)
+
+    def _clear_status(self):
+        if self._status_after is not None:
+            self.master.after_cancel(self._status_after)
+            self._status_after = None
+        self.status_label.config(text="")
+
+    def _set_result(self, text):
+        # Evita el viaje a Tcl cuando el texto no cambia (p. ej. al
+        # repetir la misma operación con los mismos operandos).
+        if text != self._result_text:
+            self._result_text = text
+            self._result_config(text=text)
 
     def _get_values(self):
+        key = (self._get1(), self._get2())
+        if key == self._values_key:
+            return self._values
         try:
-            a = float(self.entry1.get())
-            b = float(self.entry2.get())
-            return a, b
+            values = (float(key[0]), float(key[1]))
         except ValueError:
-            self.result_label.config(text="Error: Ingresa números válidos.")
+            self.show_error("Error: Ingresa números válidos.")
             return None, None
+        self._values_key = key
+        self._values = values
+        return values
 
-    def _calculate_and_display(self, operation):
+    def _calculate_and_display(self, symbol):
         a, b = self._get_values()
         if a is not None:
             try:
-                result = self.calculator.calculate(a, b, operation)
-                self.result_label.config(text=f"Resultado: {result}")
+                result = _calc(symbol, a, b)
             except Exception as e:
-                self.result_label.config(text=f"Error: {e}")
-
-    def add(self):
-        self._calculate_and_display(Add())
-
-    def subtract(self):
-        self._calculate_and_display(Subtract())
-
-    def multiply(self):
-        self._calculate_and_display(Multiply())
+                self.show_error(f"Error: {e}")
+            else:
+                self._clear_status()
+                self._set_result(f"Resultado: {_fmt(result)}")
 
-    def divide(self):
-        self._calculate_and_display(Divide())
     # add method for clean inputs
     def clear_inputs(self):
         self.entry1.delete(0, tk.END)
         self.entry2.delete(0, tk.END)
-        self.result_label.config(text="Resultado: ")
+        self._clear_status()
+        self._set_result("Resultado: ")
 
 # ----------------------------
 # Lanzar aplicación
@@ -111,6 +138,9 @@ class CalculatorGUI:
 
 if __name__ == "__main__":
     root = tk.Tk()
-    root.tk.call("tk", "scaling", 5.0)
+    # Escalado según el DPI real de la pantalla (~1.33 a 96 DPI) en vez
+    # del 5.0 fijo, que sobre-rasterizaba fuentes y widgets.
+    dpi = root.winfo_fpixels('1i')
+    root.tk.call("tk", "scaling", dpi / 72.0)
     app = CalculatorGUI(root)
     root.mainloop()